@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api_openligadb import OpenLigaDbClient
-from .const import DOMAIN, PLATFORMS
+from .const import DATA_CLIENT, DOMAIN, PLATFORMS
 from .coordinator import MatchdayCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,8 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Matchday from a config entry."""
-    session = async_get_clientsession(hass)
-    api_client = OpenLigaDbClient(session)
+    api_client = _get_client(hass)
 
     coordinator = MatchdayCoordinator(hass, entry, api_client)
     await coordinator.async_config_entry_first_refresh()
@@ -32,5 +31,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data = hass.data[DOMAIN]
+        domain_data.pop(entry.entry_id)
+        if domain_data.keys() == {DATA_CLIENT}:
+            hass.data.pop(DOMAIN)
     return unloaded
+
+
+def _get_client(hass: HomeAssistant) -> OpenLigaDbClient:
+    """Return the OpenLigaDB client shared by all Matchday entries.
+
+    Sharing one client lets every team in the same league/season reuse a
+    single cached match-data download and in-flight request.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = domain_data.get(DATA_CLIENT)
+    if client is None:
+        client = domain_data[DATA_CLIENT] = OpenLigaDbClient(async_get_clientsession(hass))
+    return client
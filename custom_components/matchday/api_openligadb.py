@@ -3,16 +3,39 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
 import aiohttp
 
-from .const import OPENLIGADB_BASE_URL, OPENLIGADB_LEAGUE_SHORTCUTS
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    import json as _json
+
+from .const import (
+    LEAGUE_NAMES,
+    OPENLIGADB_BASE_URL,
+    OPENLIGADB_LEAGUE_SHORTCUTS,
+    OPENLIGADB_MATCHDATA_TTL,
+    OPENLIGADB_REQUESTS_PER_MINUTE,
+    STANDINGS_CACHE_TTL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_loads = _json.loads
+_LEAGUE_NAME_DEFAULT = "League {}".format
+
+# Shared, read-only status dicts for normalised fixtures
+_LIVE_WINDOW_S = 150 * 60
+_STATUS_FT = {"short": "FT", "long": "Match Finished", "elapsed": None}
+_STATUS_LIVE = {"short": "LIVE", "long": "In Progress", "elapsed": None}
+_STATUS_NS = {"short": "NS", "long": "Not Started", "elapsed": None}
+
 
 class OpenLigaDbError(Exception):
     """General OpenLigaDB error."""
@@ -21,94 +44,228 @@ class OpenLigaDbError(Exception):
 class OpenLigaDbClient:
     """Async HTTP client for OpenLigaDB v1 (no authentication required)."""
 
+    __slots__ = (
+        "_session",
+        "_headers",
+        "_matchdata_cache",
+        "_matchdata_locks",
+        "_standings_cache",
+        "_bucket",
+        "_inflight",
+        "_etags",
+        "_last_body",
+    )
+
     def __init__(self, session: aiohttp.ClientSession) -> None:
         self._session = session
+        # HA's shared session already pools connections; the explicit header
+        # keeps upstream proxies from downgrading them to Connection: close.
+        self._headers = {"Connection": "keep-alive"}
+        # (shortcut, season) -> (fetched_at, {team_id: [fixtures]})
+        self._matchdata_cache: dict[tuple[str, int], tuple[float, dict[int, list[dict]]]] = {}
+        self._matchdata_locks: dict[tuple[str, int], asyncio.Lock] = {}
+        # (shortcut, season) -> (fetched_at, {team_id: entry}); dropped when
+        # one of the league's matches finishes
+        self._standings_cache: dict[tuple[str, int], tuple[float, dict[int, dict]]] = {}
+        # Token bucket: each request holds a token for 60 s, pacing bursts
+        # instead of letting the server reject them.
+        self._bucket = asyncio.Semaphore(OPENLIGADB_REQUESTS_PER_MINUTE)
+        # path -> in-flight fetch; concurrent callers await the same task
+        self._inflight: dict[str, asyncio.Task] = {}
+        # url -> last ETag / parsed body, for conditional GETs
+        self._etags: dict[str, str] = {}
+        self._last_body: dict[str, Any] = {}
 
     async def _request(self, path: str) -> Any:
+        """GET a path, sharing one upstream request among concurrent callers."""
+        task = self._inflight.get(path)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(path))
+            self._inflight[path] = task
+            task.add_done_callback(functools.partial(self._fetch_done, path))
+        # Shield so a cancelled caller does not abort the fetch for the others
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, path: str, task: asyncio.Task) -> None:
+        self._inflight.pop(path, None)
+        # Mark the exception retrieved: if every shielded caller was
+        # cancelled, nothing else would and asyncio would log it as lost.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(self, path: str) -> Any:
         url = f"{OPENLIGADB_BASE_URL}/{path}"
+        await self._bucket.acquire()
+        asyncio.get_running_loop().call_later(60, self._bucket.release)
+        headers = self._headers
+        etag = self._etags.get(url)
+        if etag is not None and url in self._last_body:
+            headers = {**headers, "If-None-Match": etag}
         try:
             async with self._session.get(
                 url,
+                headers=headers,
                 timeout=aiohttp.ClientTimeout(total=30),
             ) as response:
+                if response.status == 304:
+                    return self._last_body[url]
                 response.raise_for_status()
-                body = await response.text()
+                body = await response.read()
+                etag = response.headers.get("ETag")
         except (aiohttp.ClientError, asyncio.TimeoutError, TimeoutError) as err:
             raise OpenLigaDbError(f"Connection error for {path}: {err}") from err
         except Exception as err:  # noqa: BLE001
             raise OpenLigaDbError(f"Unexpected error for {path}: {err}") from err
 
         try:
-            import json as _json  # noqa: PLC0415
-            return _json.loads(body)
+            data = _loads(body)
         except ValueError as err:
-            _LOGGER.error("Non-JSON response from %s (first 200 chars): %s", path, body[:200])
+            if _LOGGER.isEnabledFor(logging.ERROR):
+                _LOGGER.error(
+                    "Non-JSON response from %s (first 200 chars): %s",
+                    path,
+                    body[:200].decode("utf-8", errors="replace"),
+                )
             raise OpenLigaDbError(f"Non-JSON response from {path}") from err
 
+        if etag:
+            self._etags[url] = etag
+            self._last_body[url] = data
+        return data
+
     # ------------------------------------------------------------------
     # Public API – same interface as MatchdayApiClient
     # ------------------------------------------------------------------
 
     async def get_teams(self, league_id: int, season: int) -> list[dict]:
         """Return teams for a league/season in API-Football format, sorted by name."""
-        shortcut = OPENLIGADB_LEAGUE_SHORTCUTS.get(league_id)
-        if not shortcut:
-            raise OpenLigaDbError(f"No OpenLigaDB shortcut for league ID {league_id}")
+        shortcut = _resolve_shortcut(league_id)
 
         raw = await self._request(f"getavailableteams/{shortcut}/{season}")
         if not isinstance(raw, list):
             return []
 
         teams = [_normalize_team(t) for t in raw]
-        return sorted(teams, key=lambda t: t.get("team", {}).get("name", ""))
+        teams.sort(key=lambda t: t["team"]["name"])
+        return teams
 
     async def get_fixtures(self, league_id: int, season: int, team_id: int) -> list[dict]:
         """Return all fixtures for the given team in API-Football-compatible format."""
-        shortcut = OPENLIGADB_LEAGUE_SHORTCUTS.get(league_id)
-        if not shortcut:
-            raise OpenLigaDbError(f"No OpenLigaDB shortcut for league ID {league_id}")
-
-        raw = await self._request(f"getmatchdata/{shortcut}/{season}")
-        if not isinstance(raw, list):
-            return []
-
-        now = datetime.now(tz=timezone.utc)
-        fixtures = []
-        for match in raw:
-            home_id = match.get("team1", {}).get("teamId")
-            away_id = match.get("team2", {}).get("teamId")
-            if team_id not in (home_id, away_id):
-                continue
-            fixtures.append(_normalize_fixture(match, league_id, now))
+        shortcut = _resolve_shortcut(league_id)
 
-        return fixtures
+        by_team = await self._get_matchdata(shortcut, league_id, season)
+        return list(by_team.get(team_id, []))
 
     async def get_standings(self, league_id: int, season: int) -> list[dict]:
         """Return standings in API-Football-compatible format."""
-        shortcut = OPENLIGADB_LEAGUE_SHORTCUTS.get(league_id)
-        if not shortcut:
-            raise OpenLigaDbError(f"No OpenLigaDB shortcut for league ID {league_id}")
+        shortcut = _resolve_shortcut(league_id)
 
         raw = await self._request(f"getbltable/{shortcut}/{season}")
         if not isinstance(raw, list):
             return []
 
-        from .const import LEAGUE_NAMES  # noqa: PLC0415
-        league_name = LEAGUE_NAMES.get(league_id, f"League {league_id}")
+        league_name = LEAGUE_NAMES.get(league_id) or _LEAGUE_NAME_DEFAULT(league_id)
 
         return _normalize_standings(raw, league_id, league_name)
 
+    async def get_standings_by_team(self, league_id: int, season: int) -> dict[int, dict]:
+        """Return standings entries indexed by team ID.
+
+        The table is fetched at most once per STANDINGS_CACHE_TTL and shared
+        by every entry tracking a team in the same league/season.
+        """
+        key = (_resolve_shortcut(league_id), season)
+        cached = self._standings_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < STANDINGS_CACHE_TTL:
+            return cached[1]
+
+        standings = _index_standings(await self.get_standings(league_id, season))
+        self._standings_cache[key] = (time.monotonic(), standings)
+        return standings
+
+    def invalidate_standings(self, league_id: int, season: int, fetched_before: float) -> bool:
+        """Drop the cached table if it was fetched before ``fetched_before``.
+
+        Returns True if a table was dropped, i.e. the next lookup refetches.
+        """
+        key = (_resolve_shortcut(league_id), season)
+        cached = self._standings_cache.get(key)
+        if cached is None or cached[0] >= fetched_before:
+            return False
+        del self._standings_cache[key]
+        return True
+
+    async def fetch_all(
+        self, league_id: int, season: int, team_id: int
+    ) -> tuple[list[dict], dict[int, dict]]:
+        """Fetch fixtures and indexed standings concurrently and return both."""
+        results = await asyncio.gather(
+            self.get_fixtures(league_id, season, team_id),
+            self.get_standings_by_team(league_id, season),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        fixtures, standings = results
+        return fixtures, standings
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _get_matchdata(
+        self, shortcut: str, league_id: int, season: int
+    ) -> dict[int, list[dict]]:
+        """Return the season's normalised fixtures indexed by team ID.
+
+        The payload is fetched at most once per OPENLIGADB_MATCHDATA_TTL;
+        concurrent callers for the same league/season share one request.
+        """
+        key = (shortcut, season)
+        lock = self._matchdata_locks.get(key)
+        if lock is None:
+            lock = self._matchdata_locks[key] = asyncio.Lock()
+        async with lock:
+            cached = self._matchdata_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < OPENLIGADB_MATCHDATA_TTL:
+                return cached[1]
+
+            raw = await self._request(f"getmatchdata/{shortcut}/{season}")
+
+            by_team: dict[int, list[dict]] = {}
+            if isinstance(raw, list):
+                now = datetime.now(tz=timezone.utc)
+                for match in raw:
+                    fixture = _normalize_fixture(match, league_id, now)
+                    home_id = match.get("team1", {}).get("teamId")
+                    away_id = match.get("team2", {}).get("teamId")
+                    for team_id in (home_id, away_id):
+                        if team_id is not None:
+                            by_team.setdefault(team_id, []).append(fixture)
+
+            self._matchdata_cache[key] = (time.monotonic(), by_team)
+            return by_team
+
 
 # ---------------------------------------------------------------------------
 # Normalisation helpers – map OpenLigaDB format → API-Football format
 # ---------------------------------------------------------------------------
 
+def _resolve_shortcut(league_id: int) -> str:
+    """Return the OpenLigaDB shortcut for a league ID or raise OpenLigaDbError."""
+    shortcut = OPENLIGADB_LEAGUE_SHORTCUTS.get(league_id)
+    if not shortcut:
+        raise OpenLigaDbError(f"No OpenLigaDB shortcut for league ID {league_id}")
+    return shortcut
+
+
 def _normalize_team(team: dict) -> dict:
     """Wrap an OpenLigaDB team entry in API-Football's team/venue envelope."""
     return {
         "team": {
             "id": team.get("teamId"),
-            "name": team.get("teamName", ""),
+            "name": team.get("teamName") or "",
             "logo": team.get("teamIconUrl"),
         },
         "venue": {},
@@ -118,8 +275,9 @@ def _normalize_team(team: dict) -> dict:
 def _normalize_fixture(match: dict, league_id: int, now: datetime) -> dict:
     """Convert a single OpenLigaDB match dict to API-Football fixture format."""
     results = match.get("matchResults") or []
-    final = next((r for r in results if r.get("resultTypeID") == 2), None)
-    halftime = next((r for r in results if r.get("resultTypeID") == 1), None)
+    by_type = {r.get("resultTypeID"): r for r in results}
+    final = by_type.get(2)
+    halftime = by_type.get(1)
 
     is_finished: bool = match.get("matchIsFinished", False)
 
@@ -128,22 +286,15 @@ def _normalize_fixture(match: dict, league_id: int, now: datetime) -> dict:
 
     # Determine match status
     if is_finished:
-        status_short = "FT"
-        status_long = "Match Finished"
+        status = _STATUS_FT
     else:
         # Check if the match has likely already kicked off (within 2.5-hour window)
-        match_dt = _parse_utc(date_str)
+        match_dt = parse_utc(date_str)
+        status = _STATUS_NS
         if match_dt is not None:
-            minutes_since_ko = (now - match_dt).total_seconds() / 60
-            if 0 <= minutes_since_ko <= 150:
-                status_short = "LIVE"
-                status_long = "In Progress"
-            else:
-                status_short = "NS"
-                status_long = "Not Started"
-        else:
-            status_short = "NS"
-            status_long = "Not Started"
+            seconds_since_ko = (now - match_dt).total_seconds()
+            if 0 <= seconds_since_ko <= _LIVE_WINDOW_S:
+                status = _STATUS_LIVE
 
     location = match.get("location") or {}
 
@@ -151,11 +302,7 @@ def _normalize_fixture(match: dict, league_id: int, now: datetime) -> dict:
         "fixture": {
             "id": match.get("matchID"),
             "date": date_str,
-            "status": {
-                "short": status_short,
-                "long": status_long,
-                "elapsed": None,
-            },
+            "status": status,
             "venue": {
                 "name": location.get("locationStadium"),
                 "city": location.get("locationCity"),
@@ -227,17 +374,40 @@ def _normalize_standings(
     return [{"league": {"id": league_id, "name": league_name, "standings": [group]}}]
 
 
-def _parse_utc(date_str: str) -> datetime | None:
-    """Parse an ISO-8601 string and return a UTC-aware datetime, or None."""
-    if not date_str:
+def _index_standings(standings: list[dict]) -> dict[int, dict]:
+    """Flatten the standings envelope into a {team_id: entry} dict."""
+    return {
+        entry.get("team", {}).get("id"): entry
+        for league_entry in standings
+        for group in league_entry.get("league", {}).get("standings", [])
+        for entry in group
+    }
+
+
+def parse_utc(date_str: str) -> datetime | None:
+    """Parse an ISO-8601 string and return a UTC-aware datetime, or None.
+
+    Public so the coordinator parses fixture dates through the same
+    memoised fast path instead of keeping a second parser.
+    """
+    if not date_str or not isinstance(date_str, str):
         return None
+    return _parse_utc_cached(date_str)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_utc_cached(date_str: str) -> datetime | None:
+    """Memoised worker for parse_utc; kick-off times repeat across polls."""
     try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except (ValueError, AttributeError):
-        return None
+        dt = datetime.fromisoformat(date_str)
+    except ValueError:
+        try:
+            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
 
 
 def _safe_int(value: Any) -> int | None:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -31,11 +31,31 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-AVAILABLE_LEAGUES = [
+AVAILABLE_LEAGUES: Final[list[SelectOptionDict]] = [
     SelectOptionDict(value=str(lid), label=name)
     for lid, name in LEAGUE_NAMES.items()
 ]
 
+# Step 1 does not depend on flow state, so build the selectors only once
+_STEP_USER_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_LEAGUE_ID, default=str(LEAGUE_2_BUNDESLIGA)): SelectSelector(
+            SelectSelectorConfig(
+                options=AVAILABLE_LEAGUES,
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Required(CONF_SEASON, default=2025): NumberSelector(
+            NumberSelectorConfig(
+                min=2010,
+                max=2030,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+    }
+)
+
 
 class MatchdayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Two-step config flow: league/season → team selection."""
@@ -46,6 +66,9 @@ class MatchdayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._league_id: int = LEAGUE_2_BUNDESLIGA
         self._season: int = 2025
         self._teams: list[dict] = []
+        self._client: OpenLigaDbClient | None = None
+        self._team_options: list[SelectOptionDict] = []
+        self._team_name_by_id: dict[int, str] = {}
 
     # ------------------------------------------------------------------
     # Step 1: league + season
@@ -60,8 +83,10 @@ class MatchdayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             league_id = int(user_input[CONF_LEAGUE_ID])
             season = int(user_input[CONF_SEASON])
 
-            session = async_get_clientsession(self.hass)
-            client = OpenLigaDbClient(session)
+            # Reuse one client (and the shared HA session) across form retries
+            if self._client is None:
+                self._client = OpenLigaDbClient(async_get_clientsession(self.hass))
+            client = self._client
 
             try:
                 self._teams = await client.get_teams(league_id, season)
@@ -77,28 +102,19 @@ class MatchdayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not errors:
                 self._league_id = league_id
                 self._season = season
+                self._team_options = [
+                    SelectOptionDict(
+                        value=str(t["team"]["id"]),
+                        label=t["team"]["name"],
+                    )
+                    for t in self._teams
+                ]
+                self._team_name_by_id = {t["team"]["id"]: t["team"]["name"] for t in self._teams}
                 return await self.async_step_team()
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_LEAGUE_ID, default=str(LEAGUE_2_BUNDESLIGA)): SelectSelector(
-                        SelectSelectorConfig(
-                            options=AVAILABLE_LEAGUES,
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Required(CONF_SEASON, default=2025): NumberSelector(
-                        NumberSelectorConfig(
-                            min=2010,
-                            max=2030,
-                            step=1,
-                            mode=NumberSelectorMode.BOX,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_STEP_USER_SCHEMA,
             errors=errors,
         )
 
@@ -113,14 +129,7 @@ class MatchdayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             team_id = int(user_input[CONF_TEAM_ID])
-            team_name = next(
-                (
-                    t["team"]["name"]
-                    for t in self._teams
-                    if t["team"]["id"] == team_id
-                ),
-                str(team_id),
-            )
+            team_name = self._team_name_by_id.get(team_id, str(team_id))
 
             await self.async_set_unique_id(f"{self._league_id}_{team_id}_{self._season}")
             self._abort_if_unique_id_configured()
@@ -137,21 +146,13 @@ class MatchdayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        team_options = [
-            SelectOptionDict(
-                value=str(t["team"]["id"]),
-                label=t["team"]["name"],
-            )
-            for t in self._teams
-        ]
-
         return self.async_show_form(
             step_id="team",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_TEAM_ID): SelectSelector(
                         SelectSelectorConfig(
-                            options=team_options,
+                            options=self._team_options,
                             mode=SelectSelectorMode.DROPDOWN,
                         )
                     ),
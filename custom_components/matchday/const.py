@@ -1,8 +1,13 @@
 """Constants for the Matchday integration."""
 
+from types import MappingProxyType
+
 DOMAIN = "matchday"
 PLATFORMS = ["sensor"]
 
+# hass.data[DOMAIN] key for the OpenLigaDB client shared by all entries
+DATA_CLIENT = "client"
+
 # Config entry keys
 CONF_LEAGUE_ID = "league_id"
 CONF_TEAM_ID = "team_id"
@@ -12,31 +17,45 @@ CONF_SEASON = "season"
 # OpenLigaDB
 OPENLIGADB_BASE_URL = "https://api.openligadb.de"
 # Maps well-known league IDs to OpenLigaDB shortcut strings
-OPENLIGADB_LEAGUE_SHORTCUTS = {
+OPENLIGADB_LEAGUE_SHORTCUTS = MappingProxyType({
     78: "bl1",   # 1. Bundesliga
     79: "bl2",   # 2. Bundesliga
     81: "dfb",   # DFB Pokal
-}
+})
+# Client-side cap on requests sent to OpenLigaDB in any rolling minute
+OPENLIGADB_REQUESTS_PER_MINUTE = 30
 
 # Well-known league IDs
 LEAGUE_1_BUNDESLIGA = 78
 LEAGUE_2_BUNDESLIGA = 79
 LEAGUE_DFB_POKAL = 81
 
-LEAGUE_NAMES = {
+LEAGUE_NAMES = MappingProxyType({
     78: "1. Bundesliga",
     79: "2. Bundesliga",
     81: "DFB Pokal",
-}
+})
 
 # Update intervals (in minutes)
 SCAN_INTERVAL_DEFAULT = 30   # Idle days
 SCAN_INTERVAL_MATCHDAY = 5   # Match day, pre/post match
 SCAN_INTERVAL_LIVE = 1       # During an active match
 
+# How long a downloaded season's match data is reused (in seconds). Kept at
+# half the live interval: HA schedules refreshes up to a second early, so a
+# TTL equal to the interval would serve every other live poll from cache.
+OPENLIGADB_MATCHDATA_TTL = SCAN_INTERVAL_LIVE * 60 // 2
+
+# Standings are reused for this long unless one of our matches finishes (in seconds)
+STANDINGS_CACHE_TTL = 900
+# Refreshes arriving this soon after a completed fetch reuse its result (in seconds)
+FETCH_REUSE_WINDOW = 2
+
 # Match status codes (OpenLigaDB maps to these)
-LIVE_STATUS_CODES = {"1H", "HT", "2H", "ET", "BT", "P", "SUSP", "INT", "LIVE"}
-FINISHED_STATUS_CODES = {"FT", "AET", "PEN"}
+LIVE_STATUS_CODES: frozenset[str] = frozenset(
+    {"1H", "HT", "2H", "ET", "BT", "P", "SUSP", "INT", "LIVE"}
+)
+FINISHED_STATUS_CODES: frozenset[str] = frozenset({"FT", "AET", "PEN"})
 
 # Sensor entity IDs
 SENSOR_NEXT_MATCH = "next_match"
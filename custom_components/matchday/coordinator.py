@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, NamedTuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api_openligadb import OpenLigaDbClient, OpenLigaDbError
+from .api_openligadb import OpenLigaDbClient, OpenLigaDbError, parse_utc
 from .const import (
     CONF_LEAGUE_ID,
     CONF_SEASON,
     CONF_TEAM_ID,
+    FETCH_REUSE_WINDOW,
     FINISHED_STATUS_CODES,
     LIVE_STATUS_CODES,
     SCAN_INTERVAL_DEFAULT,
@@ -23,6 +29,26 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared stand-in for missing sub-dicts; read-only so it can never be filled
+_EMPTY: MappingProxyType = MappingProxyType({})
+
+# Poll interval per coordinator state (in seconds)
+_INTERVAL_SECONDS = {
+    "live": SCAN_INTERVAL_LIVE * 60,
+    "matchday": SCAN_INTERVAL_MATCHDAY * 60,
+    "idle": SCAN_INTERVAL_DEFAULT * 60,
+}
+
+
+class FixtureMeta(NamedTuple):
+    """Per-fixture values derived from our team's side of the match."""
+
+    is_home: bool
+    opponent: dict
+    our_goals: int | None
+    their_goals: int | None
+    venue: Mapping[str, Any]
+
 
 class MatchdayCoordinator(DataUpdateCoordinator):
     """Fetch and cache Matchday data; adjusts poll interval automatically."""
@@ -39,11 +65,23 @@ class MatchdayCoordinator(DataUpdateCoordinator):
             name="Matchday",
             config_entry=config_entry,
             update_interval=timedelta(minutes=SCAN_INTERVAL_DEFAULT),
+            # Only notify sensors when the processed data actually changed
+            always_update=False,
         )
         self._api = api_client
         self._league_id: int = config_entry.data[CONF_LEAGUE_ID]
         self._season: int = config_entry.data[CONF_SEASON]
         self._team_id: int = config_entry.data[CONF_TEAM_ID]
+        self._seen_live_ids: set[int] = set()
+        self._current_interval_s: int = _INTERVAL_SECONDS["idle"]
+        self._fetch_lock = asyncio.Lock()
+        self._last_fetch: tuple[float, dict] | None = None
+        # Read-only attributes shared by every sensor showing the same fixture
+        self._cached_attrs: dict[str, Mapping[str, Any]] = {}
+        # Attribute-style access to the current fixtures for the sensors
+        self.view = _make_view({})
+        self.next_meta: FixtureMeta | None = None
+        self.last_meta: FixtureMeta | None = None
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -57,6 +95,15 @@ class MatchdayCoordinator(DataUpdateCoordinator):
     def team_id(self) -> int:
         return self._team_id
 
+    @property
+    def cached_attrs(self) -> dict[str, Mapping[str, Any]]:
+        """Common fixture attributes for the "next", "last" and "live" fixtures.
+
+        The values are read-only views shared between sensors; copy before
+        adding sensor-specific fields.
+        """
+        return self._cached_attrs
+
     # ------------------------------------------------------------------
     # Core fetch
     # ------------------------------------------------------------------
@@ -64,91 +111,173 @@ class MatchdayCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self) -> dict:
         """Fetch all data from OpenLigaDB and return a processed dict."""
         try:
-            fixtures = await self._api.get_fixtures(self._league_id, self._season, self._team_id)
-            standings = await self._api.get_standings(self._league_id, self._season)
+            processed = await self._fetch_fixtures_and_standings()
         except OpenLigaDbError as err:
             raise UpdateFailed(f"OpenLigaDB error: {err}") from err
 
-        processed = self._process_fixtures(fixtures)
-        processed["standing"] = self._extract_standing(standings)
+        # Rebuilt on every successful refresh, which doubles as invalidation
+        self._cached_attrs = {
+            name: MappingProxyType(_fixture_attributes(fixture)) if fixture else _EMPTY
+            for name, fixture in (
+                ("next", processed["next_match"]),
+                ("last", processed["last_match"]),
+                ("live", processed["live"]),
+            )
+        }
+        self.view = _make_view(processed)
+        self.next_meta = _compute_fixture_meta(processed["next_match"], self._team_id)
+        self.last_meta = _compute_fixture_meta(processed["last_match"], self._team_id)
         self._adjust_poll_interval(processed)
 
         return processed
 
+    async def _fetch_fixtures_and_standings(self) -> dict:
+        """Fetch and process fixtures plus standing, coalescing refresh bursts.
+
+        Overlapping refreshes wait on the lock; any that arrive within
+        FETCH_REUSE_WINDOW seconds of a completed fetch reuse its result.
+        """
+        async with self._fetch_lock:
+            last = self._last_fetch
+            if last is not None and time.monotonic() - last[0] < FETCH_REUSE_WINDOW:
+                return last[1]
+
+            started = time.monotonic()
+            fixtures, standings = await self._api.fetch_all(
+                self._league_id, self._season, self._team_id
+            )
+            processed, final_whistle = self._process_fixtures(fixtures)
+            # Refetch the table after a final whistle, unless this tick's
+            # copy was already downloaded alongside the finished fixture
+            if final_whistle and self._api.invalidate_standings(
+                self._league_id, self._season, fetched_before=started
+            ):
+                standings = await self._api.get_standings_by_team(self._league_id, self._season)
+
+            processed["standing"] = standings.get(self._team_id)
+            self._last_fetch = (time.monotonic(), processed)
+            return processed
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _process_fixtures(self, fixtures: list[dict]) -> dict:
+    def _process_fixtures(self, fixtures: list[dict]) -> tuple[dict, bool]:
+        """Return the processed fixtures and whether a match seen live finished."""
         now = datetime.now(tz=timezone.utc)
-        upcoming: list[dict] = []
-        past: list[dict] = []
+        final_whistle = False
+        best_upcoming: tuple[datetime, dict] | None = None
+        best_past: tuple[datetime, dict] | None = None
         live: dict | None = None
 
         for fixture in fixtures:
-            status_short = fixture["fixture"]["status"]["short"]
+            fi = fixture["fixture"]
+            status_short = fi["status"]["short"]
+            fixture_id = fi.get("id")
 
             if status_short in LIVE_STATUS_CODES:
                 live = fixture
+                self._seen_live_ids.add(fixture_id)
                 continue
 
-            raw_date = fixture["fixture"].get("date")
+            if status_short in FINISHED_STATUS_CODES and fixture_id in self._seen_live_ids:
+                # Final whistle: the league table is about to change
+                self._seen_live_ids.discard(fixture_id)
+                final_whistle = True
+
+            raw_date = fi.get("date")
             if not raw_date:
                 continue
 
-            try:
-                match_dt = datetime.fromisoformat(raw_date.replace("Z", "+00:00"))
-                if match_dt.tzinfo is None:
-                    match_dt = match_dt.replace(tzinfo=timezone.utc)
-            except ValueError:
+            match_dt = parse_utc(raw_date)
+            if match_dt is None:
                 continue
 
             if status_short in FINISHED_STATUS_CODES or match_dt <= now:
-                past.append(fixture)
-            else:
-                upcoming.append(fixture)
-
-        upcoming.sort(key=lambda f: f["fixture"]["date"])
-        past.sort(key=lambda f: f["fixture"]["date"], reverse=True)
+                if best_past is None or match_dt > best_past[0]:
+                    best_past = (match_dt, fixture)
+            elif best_upcoming is None or match_dt < best_upcoming[0]:
+                best_upcoming = (match_dt, fixture)
 
-        return {
+        processed = {
             "live": live,
-            "next_match": upcoming[0] if upcoming else None,
-            "last_match": past[0] if past else None,
+            "next_match": best_upcoming[1] if best_upcoming else None,
+            "next_match_dt": best_upcoming[0] if best_upcoming else None,
+            "last_match": best_past[1] if best_past else None,
+            "today": now.date(),
         }
-
-    def _extract_standing(self, standings: list[dict]) -> dict | None:
-        for league_entry in standings:
-            for group in league_entry.get("league", {}).get("standings", []):
-                for entry in group:
-                    if entry.get("team", {}).get("id") == self._team_id:
-                        return entry
-        return None
+        return processed, final_whistle
 
     def _adjust_poll_interval(self, data: dict) -> None:
         if data.get("live"):
-            new_interval = timedelta(minutes=SCAN_INTERVAL_LIVE)
-        elif data.get("next_match") and self._is_today(data["next_match"]):
-            new_interval = timedelta(minutes=SCAN_INTERVAL_MATCHDAY)
+            state = "live"
+        elif self._is_today(data):
+            state = "matchday"
         else:
-            new_interval = timedelta(minutes=SCAN_INTERVAL_DEFAULT)
+            state = "idle"
 
-        if self.update_interval != new_interval:
-            _LOGGER.debug(
-                "Adjusting poll interval to %s minutes",
-                int(new_interval.total_seconds() / 60),
-            )
-            self.update_interval = new_interval
+        new_s = _INTERVAL_SECONDS[state]
+        if new_s != self._current_interval_s:
+            _LOGGER.debug("Adjusting poll interval to %s minutes", new_s // 60)
+            self._current_interval_s = new_s
+            self.update_interval = timedelta(seconds=new_s)
 
     @staticmethod
-    def _is_today(fixture: dict) -> bool:
-        raw_date = fixture["fixture"].get("date")
-        if not raw_date:
-            return False
-        try:
-            match_dt = datetime.fromisoformat(raw_date.replace("Z", "+00:00"))
-            if match_dt.tzinfo is None:
-                match_dt = match_dt.replace(tzinfo=timezone.utc)
-            return match_dt.date() == datetime.now(tz=timezone.utc).date()
-        except ValueError:
-            return False
+    def _is_today(data: dict) -> bool:
+        """Return True if the next match kicks off today (UTC)."""
+        match_dt = data.get("next_match_dt")
+        return match_dt is not None and match_dt.date() == data["today"]
+
+
+def _make_view(data: dict) -> SimpleNamespace:
+    """Return the sensor-facing view of a processed data dict."""
+    return SimpleNamespace(
+        next_match=data.get("next_match"),
+        next_match_dt=data.get("next_match_dt"),
+        last_match=data.get("last_match"),
+        standing=data.get("standing"),
+        live=data.get("live"),
+    )
+
+
+def _compute_fixture_meta(fixture: dict | None, team_id: int) -> FixtureMeta | None:
+    """Resolve home/away, opponent and goal split for a fixture once."""
+    if not fixture:
+        return None
+    home = fixture["teams"]["home"]
+    away = fixture["teams"]["away"]
+    goals = fixture.get("goals") or _EMPTY
+    is_home = home["id"] == team_id
+    return FixtureMeta(
+        is_home=is_home,
+        opponent=away if is_home else home,
+        our_goals=goals.get("home") if is_home else goals.get("away"),
+        their_goals=goals.get("away") if is_home else goals.get("home"),
+        venue=fixture["fixture"].get("venue") or _EMPTY,
+    )
+
+
+def _fixture_attributes(fixture: dict) -> dict[str, Any]:
+    """Return a common dict of fixture attributes shared by multiple sensors."""
+    fix = fixture.get("fixture") or _EMPTY
+    teams = fixture.get("teams") or _EMPTY
+    home = teams.get("home") or _EMPTY
+    away = teams.get("away") or _EMPTY
+    league = fixture.get("league") or _EMPTY
+    venue = fix.get("venue") or _EMPTY
+
+    return {
+        "match_id": fix.get("id"),
+        "home_team": home.get("name"),
+        "home_team_id": home.get("id"),
+        "home_logo": home.get("logo"),
+        "away_team": away.get("name"),
+        "away_team_id": away.get("id"),
+        "away_logo": away.get("logo"),
+        "venue": venue.get("name"),
+        "venue_city": venue.get("city"),
+        "referee": fix.get("referee"),
+        "round": league.get("round"),
+        "competition": league.get("name"),
+        "season": league.get("season"),
+    }
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
@@ -33,6 +38,49 @@ from .coordinator import MatchdayCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Last result indexed by sign(our_goals - their_goals) + 1
+_RESULT = ("Loss", "Draw", "Win")
+
+# Attribute name -> path into a normalised fixture / standings entry
+_LAST_MATCH_ATTR_PATHS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("home_score", ("goals", "home")),
+    ("away_score", ("goals", "away")),
+    ("halftime_home", ("score", "halftime", "home")),
+    ("halftime_away", ("score", "halftime", "away")),
+    ("status", ("fixture", "status", "long")),
+    ("match_date", ("fixture", "date")),
+)
+_STANDING_ATTR_PATHS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("team", ("team", "name")),
+    ("points", ("points",)),
+    ("played", ("all", "played")),
+    ("wins", ("all", "win")),
+    ("draws", ("all", "draw")),
+    ("losses", ("all", "lose")),
+    ("goals_for", ("all", "goals", "for")),
+    ("goals_against", ("all", "goals", "against")),
+    ("goal_difference", ("goalsDiff",)),
+    ("form", ("form",)),
+    ("description", ("description",)),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MatchdaySensorEntityDescription(SensorEntityDescription):
+    """Describes a Matchday sensor and how it derives its state.
+
+    ``source`` names the coordinator view field the sensor reads. While that
+    field is empty the sensor reports ``empty_value`` / ``empty_attrs``;
+    otherwise ``value_fn`` and ``attrs_fn`` receive the coordinator and the
+    non-empty source object.
+    """
+
+    source: str
+    value_fn: Callable[[MatchdayCoordinator, dict], Any]
+    attrs_fn: Callable[[MatchdayCoordinator, dict], Mapping[str, Any]] | None = None
+    empty_value: Any = None
+    empty_attrs: Mapping[str, Any] | None = None
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,452 +89,263 @@ async def async_setup_entry(
 ) -> None:
     coordinator: MatchdayCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
+    # The first refresh already ran in async_setup_entry, so entities are
+    # added with their state computed and need no update before add.
     async_add_entities(
-        [
-            NextMatchSensor(coordinator, config_entry),
-            LastMatchSensor(coordinator, config_entry),
-            StandingSensor(coordinator, config_entry),
-            LiveScoreSensor(coordinator, config_entry),
-            NextOpponentSensor(coordinator, config_entry),
-            LastOpponentSensor(coordinator, config_entry),
-            GoalsForSensor(coordinator, config_entry),
-            GoalsAgainstSensor(coordinator, config_entry),
-            LastResultSensor(coordinator, config_entry),
-            NextGameVenueSensor(coordinator, config_entry),
-        ]
+        (
+            MatchdaySensor(coordinator, config_entry, description)
+            for description in SENSOR_DESCRIPTIONS
+        ),
+        update_before_add=False,
     )
 
 
 # ---------------------------------------------------------------------------
-# Base class
+# Entity
 # ---------------------------------------------------------------------------
 
-class MatchdaySensorBase(CoordinatorEntity[MatchdayCoordinator], SensorEntity):
-    """Base class for all Matchday sensors."""
+class MatchdaySensor(CoordinatorEntity[MatchdayCoordinator], SensorEntity):
+    """A Matchday sensor whose state is derived by its entity description."""
+
+    entity_description: MatchdaySensorEntityDescription
 
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: MatchdayCoordinator,
+        config_entry: ConfigEntry,
+        description: MatchdaySensorEntityDescription,
+    ) -> None:
         super().__init__(coordinator)
+        self.entity_description = description
         self._config_entry = config_entry
+        self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
         self._team_name: str = config_entry.data.get(CONF_TEAM_NAME, "Team")
         league_id = coordinator.league_id
         self._league_name = LEAGUE_NAMES.get(league_id, f"League {league_id}")
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
             name=f"{self._team_name} – {self._league_name}",
             manufacturer="OpenLigaDB",
             model="Football Data",
             configuration_url="https://openligadb.de",
         )
+        self._update_state()
+        self._last_fingerprint = self._fingerprint()
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        self._update_state()
+        # The coordinator only skips listeners for identical data, so a
+        # refresh that changes fields this sensor does not expose would
+        # otherwise still write an unchanged state.
+        fingerprint = self._fingerprint()
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
         self.async_write_ha_state()
 
-    def _opponent(self, fixture: dict) -> dict:
-        """Return the opposing team dict for a given fixture."""
-        team_id = self.coordinator.team_id
-        home = fixture["teams"]["home"]
-        away = fixture["teams"]["away"]
-        return away if home["id"] == team_id else home
-
-
-# ---------------------------------------------------------------------------
-# Next Match
-# ---------------------------------------------------------------------------
-
-class NextMatchSensor(MatchdaySensorBase):
-    """Shows the date/time of the next scheduled match."""
-
-    _attr_device_class = SensorDeviceClass.TIMESTAMP
-    _attr_translation_key = "next_match"
-
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_NEXT_MATCH}"
-
-    @property
-    def native_value(self) -> datetime | None:
-        fixture = self.coordinator.data.get("next_match") if self.coordinator.data else None
-        if not fixture:
-            return None
-        return _parse_dt(fixture["fixture"]["date"])
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        fixture = self.coordinator.data.get("next_match") if self.coordinator.data else None
-        if not fixture:
-            return {}
-        return _fixture_attributes(fixture)
-
-
-# ---------------------------------------------------------------------------
-# Last Match
-# ---------------------------------------------------------------------------
-
-class LastMatchSensor(MatchdaySensorBase):
-    """Shows the result of the most recent finished match."""
-
-    _attr_translation_key = "last_match"
-
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_LAST_MATCH}"
-
-    @property
-    def native_value(self) -> str | None:
-        fixture = self.coordinator.data.get("last_match") if self.coordinator.data else None
-        if not fixture:
-            return None
-        home = fixture["teams"]["home"]["name"]
-        away = fixture["teams"]["away"]["name"]
-        gh = fixture["goals"]["home"] if fixture["goals"]["home"] is not None else "-"
-        ga = fixture["goals"]["away"] if fixture["goals"]["away"] is not None else "-"
-        return f"{home} {gh} – {ga} {away}"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        fixture = self.coordinator.data.get("last_match") if self.coordinator.data else None
-        if not fixture:
-            return {}
-        attrs = _fixture_attributes(fixture)
-        goals = fixture.get("goals", {})
-        score = fixture.get("score", {})
-        attrs.update(
-            {
-                "home_score": goals.get("home"),
-                "away_score": goals.get("away"),
-                "halftime_home": score.get("halftime", {}).get("home"),
-                "halftime_away": score.get("halftime", {}).get("away"),
-                "status": fixture["fixture"]["status"]["long"],
-                "match_date": fixture["fixture"]["date"],
-            }
+    def _fingerprint(self) -> tuple[Any, ...]:
+        """Return everything this sensor writes to the state machine."""
+        return (self.available, self._attr_native_value, self._attr_extra_state_attributes)
+
+    def _update_state(self) -> None:
+        """Derive the cached ``_attr_*`` state from the coordinator.
+
+        Runs once per coordinator update so state reads are plain attribute
+        lookups instead of property calls.
+        """
+        description = self.entity_description
+        source = getattr(self.coordinator.view, description.source)
+        if not source:
+            self._attr_native_value = description.empty_value
+            self._attr_extra_state_attributes = description.empty_attrs
+            return
+
+        self._attr_native_value = description.value_fn(self.coordinator, source)
+        self._attr_extra_state_attributes = (
+            description.attrs_fn(self.coordinator, source) if description.attrs_fn else None
         )
-        return attrs
-
-
-# ---------------------------------------------------------------------------
-# Standing
-# ---------------------------------------------------------------------------
-
-class StandingSensor(MatchdaySensorBase):
-    """Shows the team's current league position."""
-
-    _attr_native_unit_of_measurement = "position"
-    _attr_translation_key = "standing"
-
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_STANDING}"
-
-    @property
-    def native_value(self) -> int | None:
-        standing = self.coordinator.data.get("standing") if self.coordinator.data else None
-        return standing.get("rank") if standing else None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        standing = self.coordinator.data.get("standing") if self.coordinator.data else None
-        if not standing:
-            return {}
-        all_stats = standing.get("all", {})
-        goals = all_stats.get("goals", {})
-        return {
-            "team": standing.get("team", {}).get("name"),
-            "points": standing.get("points"),
-            "played": all_stats.get("played"),
-            "wins": all_stats.get("win"),
-            "draws": all_stats.get("draw"),
-            "losses": all_stats.get("lose"),
-            "goals_for": goals.get("for"),
-            "goals_against": goals.get("against"),
-            "goal_difference": standing.get("goalsDiff"),
-            "form": standing.get("form"),
-            "description": standing.get("description"),
-        }
-
-
-# ---------------------------------------------------------------------------
-# Live Score
-# ---------------------------------------------------------------------------
-
-class LiveScoreSensor(MatchdaySensorBase):
-    """Shows the live score during a match, idle otherwise."""
-
-    _attr_translation_key = "live_score"
-
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_LIVE_SCORE}"
-
-    @property
-    def native_value(self) -> str:
-        fixture = self.coordinator.data.get("live") if self.coordinator.data else None
-        if not fixture:
-            return "No live match"
-        home = fixture["teams"]["home"]["name"]
-        away = fixture["teams"]["away"]["name"]
-        gh = fixture["goals"]["home"] if fixture["goals"]["home"] is not None else 0
-        ga = fixture["goals"]["away"] if fixture["goals"]["away"] is not None else 0
-        return f"{home} {gh} – {ga} {away}"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        fixture = self.coordinator.data.get("live") if self.coordinator.data else None
-        if not fixture:
-            return {"is_live": False}
-        attrs = _fixture_attributes(fixture)
-        goals = fixture.get("goals", {})
-        attrs.update(
-            {
-                "is_live": True,
-                "minute": fixture["fixture"].get("status", {}).get("elapsed"),
-                "status": fixture["fixture"]["status"]["long"],
-                "home_score": goals.get("home", 0),
-                "away_score": goals.get("away", 0),
-            }
-        )
-        return attrs
-
-
-# ---------------------------------------------------------------------------
-# Next Opponent
-# ---------------------------------------------------------------------------
-
-class NextOpponentSensor(MatchdaySensorBase):
-    """Shows the name of the next opponent."""
-
-    _attr_translation_key = "next_opponent"
-
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_NEXT_OPPONENT}"
-
-    @property
-    def native_value(self) -> str | None:
-        fixture = self.coordinator.data.get("next_match") if self.coordinator.data else None
-        if not fixture:
-            return None
-        return self._opponent(fixture).get("name")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        fixture = self.coordinator.data.get("next_match") if self.coordinator.data else None
-        if not fixture:
-            return {}
-        opp = self._opponent(fixture)
-        return {
-            "opponent_id": opp.get("id"),
-            "opponent_logo": opp.get("logo"),
-            "match_date": fixture["fixture"]["date"],
-        }
 
 
 # ---------------------------------------------------------------------------
-# Last Opponent
+# State extractors
 # ---------------------------------------------------------------------------
 
-class LastOpponentSensor(MatchdaySensorBase):
-    """Shows the name of the last opponent."""
+def _score_line(fixture: dict, missing: Any) -> str:
+    """Return ``Home 2 – 1 Away``, substituting ``missing`` for unknown goals."""
+    home = fixture["teams"]["home"]["name"]
+    away = fixture["teams"]["away"]["name"]
+    gh = fixture["goals"]["home"] if fixture["goals"]["home"] is not None else missing
+    ga = fixture["goals"]["away"] if fixture["goals"]["away"] is not None else missing
+    return f"{home} {gh} – {ga} {away}"
 
-    _attr_translation_key = "last_opponent"
 
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_LAST_OPPONENT}"
-
-    @property
-    def native_value(self) -> str | None:
-        fixture = self.coordinator.data.get("last_match") if self.coordinator.data else None
-        if not fixture:
-            return None
-        return self._opponent(fixture).get("name")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        fixture = self.coordinator.data.get("last_match") if self.coordinator.data else None
-        if not fixture:
-            return {}
-        opp = self._opponent(fixture)
-        return {
-            "opponent_id": opp.get("id"),
-            "opponent_logo": opp.get("logo"),
-            "match_date": fixture["fixture"]["date"],
-        }
-
-
-# ---------------------------------------------------------------------------
-# Goals For (season total)
-# ---------------------------------------------------------------------------
-
-class GoalsForSensor(MatchdaySensorBase):
-    """Shows total goals scored by the team this season."""
-
-    _attr_native_unit_of_measurement = "goals"
-    _attr_translation_key = "goals_for"
-
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_GOALS_FOR}"
-
-    @property
-    def native_value(self) -> int | None:
-        standing = self.coordinator.data.get("standing") if self.coordinator.data else None
-        if not standing:
-            return None
-        return standing.get("all", {}).get("goals", {}).get("for")
-
-
-# ---------------------------------------------------------------------------
-# Goals Against (season total)
-# ---------------------------------------------------------------------------
+def _last_match_attrs(coordinator: MatchdayCoordinator, fixture: dict) -> dict[str, Any]:
+    """Return the shared "last" attributes plus the last match's score and status."""
+    return {
+        **coordinator.cached_attrs["last"],
+        **{name: _dig(fixture, path) for name, path in _LAST_MATCH_ATTR_PATHS},
+    }
 
-class GoalsAgainstSensor(MatchdaySensorBase):
-    """Shows total goals conceded by the team this season."""
 
-    _attr_native_unit_of_measurement = "goals"
-    _attr_translation_key = "goals_against"
+def _live_attrs(coordinator: MatchdayCoordinator, fixture: dict) -> dict[str, Any]:
+    """Return the shared "live" attributes plus the running minute and score."""
+    return {
+        **coordinator.cached_attrs["live"],
+        "is_live": True,
+        "minute": _dig(fixture, ("fixture", "status", "elapsed")),
+        "status": fixture["fixture"]["status"]["long"],
+        "home_score": _dig(fixture, ("goals", "home")),
+        "away_score": _dig(fixture, ("goals", "away")),
+    }
 
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_GOALS_AGAINST}"
 
-    @property
-    def native_value(self) -> int | None:
-        standing = self.coordinator.data.get("standing") if self.coordinator.data else None
-        if not standing:
-            return None
-        return standing.get("all", {}).get("goals", {}).get("against")
+def _opponent_attrs(opponent: dict, fixture: dict) -> dict[str, Any]:
+    """Return the opponent's ID and logo alongside the fixture's kick-off date."""
+    return {
+        "opponent_id": opponent.get("id"),
+        "opponent_logo": opponent.get("logo"),
+        "match_date": fixture["fixture"]["date"],
+    }
 
 
-# ---------------------------------------------------------------------------
-# Last Result (Win / Draw / Loss)
-# ---------------------------------------------------------------------------
-
-class LastResultSensor(MatchdaySensorBase):
-    """Shows whether the team won, drew, or lost their last match."""
+def _last_result(coordinator: MatchdayCoordinator, fixture: dict) -> str | None:
+    """Return Win, Draw or Loss for the last match, or None if a score is missing."""
+    meta = coordinator.last_meta
+    ours, theirs = meta.our_goals, meta.their_goals
+    if ours is None or theirs is None:
+        return None
+    return _RESULT[(ours > theirs) - (ours < theirs) + 1]
 
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_options = ["Win", "Draw", "Loss"]
-    _attr_translation_key = "last_result"
 
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_LAST_RESULT}"
+def _last_result_attrs(coordinator: MatchdayCoordinator, fixture: dict) -> dict[str, Any]:
+    """Return home/away and our goal split for the last match."""
+    meta = coordinator.last_meta
+    return {
+        "home_or_away": "Home" if meta.is_home else "Away",
+        "goals_scored": meta.our_goals,
+        "goals_conceded": meta.their_goals,
+        "match_date": fixture["fixture"]["date"],
+    }
 
-    @property
-    def native_value(self) -> str | None:
-        fixture = self.coordinator.data.get("last_match") if self.coordinator.data else None
-        if not fixture:
-            return None
-        goals = fixture.get("goals", {})
-        home_goals = goals.get("home")
-        away_goals = goals.get("away")
-        if home_goals is None or away_goals is None:
-            return None
 
-        team_id = self.coordinator.team_id
-        is_home = fixture["teams"]["home"]["id"] == team_id
-        our_goals = home_goals if is_home else away_goals
-        their_goals = away_goals if is_home else home_goals
-
-        if our_goals > their_goals:
-            return "Win"
-        if our_goals == their_goals:
-            return "Draw"
-        return "Loss"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        fixture = self.coordinator.data.get("last_match") if self.coordinator.data else None
-        if not fixture:
-            return {}
-        goals = fixture.get("goals", {})
-        team_id = self.coordinator.team_id
-        is_home = fixture["teams"]["home"]["id"] == team_id
-        return {
-            "home_or_away": "Home" if is_home else "Away",
-            "goals_scored": goals.get("home") if is_home else goals.get("away"),
-            "goals_conceded": goals.get("away") if is_home else goals.get("home"),
-            "match_date": fixture["fixture"]["date"],
-        }
+def _next_venue_attrs(coordinator: MatchdayCoordinator, fixture: dict) -> dict[str, Any]:
+    """Return the stadium and city of the next match."""
+    venue = coordinator.next_meta.venue
+    return {
+        "venue": venue.get("name"),
+        "venue_city": venue.get("city"),
+        "match_date": fixture["fixture"]["date"],
+    }
 
 
 # ---------------------------------------------------------------------------
-# Next Game Venue (Home / Away)
+# Sensor table
 # ---------------------------------------------------------------------------
 
-class NextGameVenueSensor(MatchdaySensorBase):
-    """Shows whether the next match is a home or away game."""
-
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_options = ["Home", "Away"]
-    _attr_translation_key = "next_game_venue"
-
-    def __init__(self, coordinator: MatchdayCoordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator, config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_NEXT_GAME_VENUE}"
-
-    @property
-    def native_value(self) -> str | None:
-        fixture = self.coordinator.data.get("next_match") if self.coordinator.data else None
-        if not fixture:
-            return None
-        team_id = self.coordinator.team_id
-        is_home = fixture["teams"]["home"]["id"] == team_id
-        return "Home" if is_home else "Away"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        fixture = self.coordinator.data.get("next_match") if self.coordinator.data else None
-        if not fixture:
-            return {}
-        return {
-            "venue": fixture["fixture"].get("venue", {}).get("name"),
-            "venue_city": fixture["fixture"].get("venue", {}).get("city"),
-            "match_date": fixture["fixture"]["date"],
-        }
+SENSOR_DESCRIPTIONS: tuple[MatchdaySensorEntityDescription, ...] = (
+    # Date/time of the next scheduled match
+    MatchdaySensorEntityDescription(
+        key=SENSOR_NEXT_MATCH,
+        translation_key=SENSOR_NEXT_MATCH,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        source="next_match",
+        value_fn=lambda c, f: c.view.next_match_dt,
+        attrs_fn=lambda c, f: c.cached_attrs["next"],
+    ),
+    # Result of the most recent finished match
+    MatchdaySensorEntityDescription(
+        key=SENSOR_LAST_MATCH,
+        translation_key=SENSOR_LAST_MATCH,
+        source="last_match",
+        value_fn=lambda c, f: _score_line(f, "-"),
+        attrs_fn=_last_match_attrs,
+    ),
+    # The team's current league position
+    MatchdaySensorEntityDescription(
+        key=SENSOR_STANDING,
+        translation_key=SENSOR_STANDING,
+        native_unit_of_measurement="position",
+        source="standing",
+        value_fn=lambda c, s: s.get("rank"),
+        attrs_fn=lambda c, s: {name: _dig(s, path) for name, path in _STANDING_ATTR_PATHS},
+    ),
+    # Live score during a match, idle otherwise
+    MatchdaySensorEntityDescription(
+        key=SENSOR_LIVE_SCORE,
+        translation_key=SENSOR_LIVE_SCORE,
+        source="live",
+        value_fn=lambda c, f: _score_line(f, 0),
+        attrs_fn=_live_attrs,
+        empty_value="No live match",
+        empty_attrs={"is_live": False},
+    ),
+    # Name of the next opponent
+    MatchdaySensorEntityDescription(
+        key=SENSOR_NEXT_OPPONENT,
+        translation_key=SENSOR_NEXT_OPPONENT,
+        source="next_match",
+        value_fn=lambda c, f: c.next_meta.opponent.get("name"),
+        attrs_fn=lambda c, f: _opponent_attrs(c.next_meta.opponent, f),
+    ),
+    # Name of the last opponent
+    MatchdaySensorEntityDescription(
+        key=SENSOR_LAST_OPPONENT,
+        translation_key=SENSOR_LAST_OPPONENT,
+        source="last_match",
+        value_fn=lambda c, f: c.last_meta.opponent.get("name"),
+        attrs_fn=lambda c, f: _opponent_attrs(c.last_meta.opponent, f),
+    ),
+    # Total goals scored by the team this season
+    MatchdaySensorEntityDescription(
+        key=SENSOR_GOALS_FOR,
+        translation_key=SENSOR_GOALS_FOR,
+        native_unit_of_measurement="goals",
+        source="standing",
+        value_fn=lambda c, s: _dig(s, ("all", "goals", "for")),
+    ),
+    # Total goals conceded by the team this season
+    MatchdaySensorEntityDescription(
+        key=SENSOR_GOALS_AGAINST,
+        translation_key=SENSOR_GOALS_AGAINST,
+        native_unit_of_measurement="goals",
+        source="standing",
+        value_fn=lambda c, s: _dig(s, ("all", "goals", "against")),
+    ),
+    # Whether the team won, drew, or lost their last match
+    MatchdaySensorEntityDescription(
+        key=SENSOR_LAST_RESULT,
+        translation_key=SENSOR_LAST_RESULT,
+        device_class=SensorDeviceClass.ENUM,
+        options=["Win", "Draw", "Loss"],
+        source="last_match",
+        value_fn=_last_result,
+        attrs_fn=_last_result_attrs,
+    ),
+    # Whether the next match is a home or away game
+    MatchdaySensorEntityDescription(
+        key=SENSOR_NEXT_GAME_VENUE,
+        translation_key=SENSOR_NEXT_GAME_VENUE,
+        device_class=SensorDeviceClass.ENUM,
+        options=["Home", "Away"],
+        source="next_match",
+        value_fn=lambda c, f: "Home" if c.next_meta.is_home else "Away",
+        attrs_fn=_next_venue_attrs,
+    ),
+)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _parse_dt(raw: str) -> datetime | None:
-    """Parse an ISO-8601 date string and return a timezone-aware datetime."""
-    try:
-        dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except (ValueError, TypeError, AttributeError):
-        return None
-
-
-def _fixture_attributes(fixture: dict) -> dict[str, Any]:
-    """Return a common dict of fixture attributes shared by multiple sensors."""
-    fix = fixture.get("fixture", {})
-    league = fixture.get("league", {})
-    teams = fixture.get("teams", {})
-    venue = fix.get("venue", {})
-
-    return {
-        "match_id": fix.get("id"),
-        "home_team": teams.get("home", {}).get("name"),
-        "home_team_id": teams.get("home", {}).get("id"),
-        "home_logo": teams.get("home", {}).get("logo"),
-        "away_team": teams.get("away", {}).get("name"),
-        "away_team_id": teams.get("away", {}).get("id"),
-        "away_logo": teams.get("away", {}).get("logo"),
-        "venue": venue.get("name"),
-        "venue_city": venue.get("city"),
-        "referee": fix.get("referee"),
-        "round": league.get("round"),
-        "competition": league.get("name"),
-        "season": league.get("season"),
-    }
+def _dig(data: Any, path: tuple[str, ...]) -> Any:
+    """Follow ``path`` through nested dicts, returning None at the first miss."""
+    for key in path:
+        data = data.get(key) if isinstance(data, dict) else None
+        if data is None:
+            return None
+    return data